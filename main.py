@@ -5,51 +5,136 @@ Type in a quest name into the console. Monster info is printed in the console.
 """
 
 import os
+import re
+import json
+import time
 import urllib
 import difflib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional, Sequence, List
 
 import yaml
 import requests
+import requests.adapters
 import bs4
 import pandas as pd
 
+try:
+    import rapidfuzz
+except ImportError:
+    rapidfuzz = None
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
 import utils
 
+# Prefer the C-based lxml backend when it is installed. The hot extraction paths query its tree
+# directly with XPath, skipping the per-node BeautifulSoup wrappers; everything else falls back to
+# BeautifulSoup over html.parser.
+try:
+    import lxml.html
+    HTML_PARSER = "lxml"
+except ImportError:
+    lxml = None
+    HTML_PARSER = "html.parser"
+
 
 # noinspection PyMethodMayBeStatic
 class DDOWikiScraper:
     """
     Web scraper focusing on the DDO wiki. Given a quest name, return info about monsters that show up in that quest.
     """
+    # How many monster pages to fetch at the same time.
+    max_workers = 16
+
+    # How many query results to keep in the LRU result cache.
+    max_cached_results = 32
+
     def __init__(self, configs: Dict) -> None:
         """
         Initialize this class with configs.
         """
         self.configs = configs
+        # Memo of (quest index url -> quest_urls mapping). The quest index page barely ever changes,
+        # so we only fetch and parse it once per url and reuse the result for later queries.
+        self._quest_urls_cache: Dict[str, Dict[str, str]] = dict()
+        # One session for all requests, so connections to the wiki are kept alive and pooled.
+        # Wiki pages are effectively static, so when requests_cache is available, cache responses
+        # on disk for a day and repeat fetches never touch the network at all.
+        if requests_cache is not None:
+            self.session = requests_cache.CachedSession(
+                cache_name=os.path.join(utils.get_project_root(), ".http_cache"),
+                backend="sqlite", expire_after=24 * 60 * 60, allowable_methods=("GET",))
+        else:
+            self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=self.max_workers, pool_maxsize=self.max_workers,
+            max_retries=requests.adapters.Retry(total=3, backoff_factor=0.3))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # The base url with any trailing slash removed, so site-relative hrefs can be absolutized
+        # with a plain string concat instead of a urljoin parse per link.
+        self._base = self.configs.get("ddo_wiki_base_url", "").rstrip("/")
+        # LRU memo of (normalized quest name -> result DataFrame). Interactive users often retype
+        # the same quest name, and a hit answers the query without touching the pipeline at all.
+        self._result_cache: "OrderedDict[str, pd.DataFrame]" = OrderedDict()
+        # Memo of (monster page url -> monster info). Monsters recur across quests, so later
+        # references skip the fetch and the parse entirely.
+        self._monster_cache: Dict[str, Dict[str, str]] = dict()
+        # Memo of (candidate names tuple -> normalized name -> original name), used by
+        # get_closest_matching_quest's exact-match fast path.
+        self._normalized_candidates_cache: Dict[tuple, Dict[str, str]] = dict()
+        # Matches a "Keyword: value" stat line for any of the configured columns.
+        # Compiled once here so the text scan in get_monster_info is a single linear regex pass.
+        self._info_re = re.compile(
+            r"^(" + "|".join(re.escape(keyword) for keyword in self.configs.get("columns", [])) + r")\s*:?\s*(.*)$")
 
     def get_monsters_in_quest(self, quest_name: str) -> pd.DataFrame:
         """
         Get monster info about the monsters that show up in the quest matching to quest_name.
         """
+        # Answer repeated queries straight from the LRU result cache.
+        cache_key = str(quest_name).lower().strip()
+        if cache_key in self._result_cache:
+            self._result_cache.move_to_end(cache_key)
+            return self._result_cache[cache_key].copy()
+
         # Get the quest that most closely matches the supplied quest_name.
         quest_urls = self.get_quest_urls()
         closest_matching_quest = self.get_closest_matching_quest(quest_name, list(quest_urls.keys()))
         print(f"The closest matching quest was: {closest_matching_quest}.")
 
         # Extract the monster_info using the closest matching quest to the inputted quest name.
+        # The monster pages are independent, so fetch them concurrently instead of one at a time.
         monster_urls = self.get_monster_urls(quest_urls[closest_matching_quest])
-        monster_info = [{**{"Name": key}, **self.get_monster_info(value)} for key, value in monster_urls.items()]
-
-        # Clean up the monster_info into a DataFrame.
-        df = pd.DataFrame(monster_info)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            monster_info = list(executor.map(self.get_monster_info, monster_urls.values()))
+
+        # Clean up the monster_info into a DataFrame. The schema is fixed, so hand pandas a dict of
+        # equal-length columns; that is its fast path and skips per-row type inference.
+        columns = {"Name": list(monster_urls.keys())}
+        for keyword in self.configs["columns"]:
+            columns[keyword] = [info.get(keyword, "") for info in monster_info]
+        df = pd.DataFrame(columns)
         if "Alignment" in df.columns:
-            df["Lawfulness"] = self.get_lawfulness(df["Alignment"])
-            df["Goodness"] = self.get_goodness(df["Alignment"])
+            split = self._split_alignments(df["Alignment"])
+            # Ordered categories sort by small integer codes instead of comparing strings, and they
+            # order the alignment axes semantically (Lawful -> Chaotic, Good -> Evil).
+            df["Lawfulness"] = self._as_ordered_category(split[0].values, ["Lawful", "Neutral", "Chaotic", ""])
+            df["Goodness"] = self._as_ordered_category(split[1].values, ["Good", "Neutral", "Evil", ""])
             df = df.drop("Alignment", axis=1)
         df = df.sort_values(["Lawfulness", "Goodness", "Race", "Name"])
         df = df.reset_index(drop=True)
 
+        # Memoize the result, evicting the least recently used query once over capacity.
+        self._result_cache[cache_key] = df
+        if len(self._result_cache) > self.max_cached_results:
+            self._result_cache.popitem(last=False)
+
         return df
 
     def get_quest_urls(self, url: Optional[str] = None) -> Dict[str, str]:
@@ -60,83 +145,186 @@ class DDOWikiScraper:
         # Get the table of quest information.
         if url is None:
             url = self.configs["ddo_wiki_quest_url"]
-        response = requests.get(url=url)
-        soup = bs4.BeautifulSoup(response.content, 'html.parser')
-        header = soup.find(id=self.configs["level"]).parent
-        table = header.find_next_sibling()
 
-        # Quest names are in the first column of the HTML table.
-        quest_names_column = table.select('table tr td:nth-of-type(1)')
+        # Return the memoized mapping if we already scraped this url.
+        if url in self._quest_urls_cache:
+            return self._quest_urls_cache[url]
+
+        # Check the on-disk cache so the mapping survives across runs.
+        cached = self._load_quest_urls_from_disk(url)
+        if cached is not None:
+            self._quest_urls_cache[url] = cached
+            return cached
 
         # Make a mapping (quest name -> quest page url).
-        quest_urls = dict()
-        for quest_name in quest_names_column:
-            quest_name = quest_name.find("a")
-            title = quest_name["title"]
-            href = quest_name["href"]
-            quest_urls[title] = urllib.parse.urljoin(self.configs["ddo_wiki_base_url"], href)
+        quest_urls = self._scrape_link_column(url, self.configs["level"])
+
+        # Memoize the mapping and save it to disk for later runs.
+        self._quest_urls_cache[url] = quest_urls
+        self._save_quest_urls_to_disk(url, quest_urls)
 
         return quest_urls
 
-    def get_monster_urls(self, url: str) -> Dict[str, str]:
+    def _scrape_link_column(self, url: str, header_id: str) -> Dict[str, str]:
         """
-        Get the mapping (monster name -> ddo wiki url of the monster's entry) from a quest page url.
-        The returned monsters all show up in the quest.
+        Fetch the url, find the table following the header with header_id, and return the mapping
+        (link title -> absolute url) built from the links in the table's first column.
+        A SoupStrainer limits parsing to the structural tags the lookup touches, so unrelated parts
+        of the page (paragraphs, lists, scripts) are never turned into Python objects.
         """
-        # Get the table of monsters that show up in the quest.
-        response = requests.get(url=url)
-        soup = bs4.BeautifulSoup(response.content, 'html.parser')
-        header = soup.find(id="Monsters").parent
-        table = header.find_next_sibling()
+        response = self.session.get(url=url)
+
+        if lxml is not None:
+            # Query the C tree with XPath directly: the header's next sibling holds a table whose
+            # first column carries the links.
+            tree = lxml.html.fromstring(response.content)
+            anchors = tree.xpath(
+                f'//*[@id="{header_id}"]/parent::*/following-sibling::*[1]//table//tr/td[1]/a')
+            links = [(anchor.get("title"), anchor.get("href")) for anchor in anchors]
+        else:
+            strainer = bs4.SoupStrainer(["div", "table", "tr", "td", "a", "h2", "h3", "h4", "span"])
+            soup = bs4.BeautifulSoup(response.content, HTML_PARSER, parse_only=strainer)
+            header = soup.find(id=header_id).parent
+            table = header.find_next_sibling()
+            # Link titles are in the first column of the HTML table.
+            names_column = table.select('table tr td:nth-of-type(1)')
+            anchors = [cell.find("a") for cell in names_column]
+            links = [(anchor["title"], anchor["href"]) for anchor in anchors]
+
+        # Make a mapping (link title -> linked page url).
+        # Wiki hrefs are site-relative paths, so a concat onto the base url suffices; anything else
+        # falls back to a proper urljoin.
+        urls = dict()
+        for title, href in links:
+            urls[title] = self._base + href if href.startswith("/") else urllib.parse.urljoin(self._base, href)
+
+        return urls
+
+    def _quest_urls_cache_path(self) -> str:
+        """
+        Return the path of the on-disk quest_urls cache file.
+        """
+        return os.path.join(os.path.expanduser("~"), ".cache", "ddo_wiki", "quest_urls.json")
 
-        # Monster names are in the first column of the HTML table.
-        monster_names_column = table.select('table tr td:nth-of-type(1)')
+    def _load_quest_urls_from_disk(self, url: str) -> Optional[Dict[str, str]]:
+        """
+        Load the quest_urls mapping for the url from the on-disk cache.
+        Return None if the cache is missing, stale (older than a day), or unreadable.
+        """
+        path = self._quest_urls_cache_path()
+        try:
+            if time.time() - os.path.getmtime(path) > 24 * 60 * 60:
+                return None
+            with open(path, "r") as file:
+                cache = json.load(file)
+        except (OSError, ValueError):
+            return None
+        return cache.get(url)
+
+    def _save_quest_urls_to_disk(self, url: str, quest_urls: Dict[str, str]) -> None:
+        """
+        Save the quest_urls mapping for the url to the on-disk cache, keeping the entries already
+        saved for other urls. Failures to write are ignored.
+        """
+        path = self._quest_urls_cache_path()
 
-        # Make a mapping (monster name -> monster page url).
-        monster_urls = dict()
-        for monster_name in monster_names_column:
-            monster_name = monster_name.find("a")
-            title = monster_name["title"]
-            href = monster_name["href"]
-            monster_urls[title] = urllib.parse.urljoin(self.configs["ddo_wiki_base_url"], href)
+        # Merge into the existing cache file, as long as it is still fresh and well-formed.
+        cache = dict()
+        try:
+            if time.time() - os.path.getmtime(path) <= 24 * 60 * 60:
+                with open(path, "r") as file:
+                    loaded = json.load(file)
+                if isinstance(loaded, dict):
+                    cache = loaded
+        except (OSError, ValueError):
+            pass
+        cache[url] = quest_urls
+
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as file:
+                json.dump(cache, file)
+        except OSError:
+            pass
 
-        return monster_urls
+    def get_monster_urls(self, url: str) -> Dict[str, str]:
+        """
+        Get the mapping (monster name -> ddo wiki url of the monster's entry) from a quest page url.
+        The returned monsters all show up in the quest.
+        """
+        # Make a mapping (monster name -> monster page url) from the quest page's Monsters table.
+        return self._scrape_link_column(url, "Monsters")
 
     def get_monster_info(self, url: str) -> Dict[str, str]:
         """
         Extract a dictionary of monster data from the supplied url.
+        Results are memoized per url for the lifetime of the scraper.
         """
-        # Load in the text containing monster information from the monster page url.
-        response = requests.get(url=url)
-        soup = bs4.BeautifulSoup(response.content, 'html.parser')
-        text = soup.find(id="mw-content-text").text
+        if url not in self._monster_cache:
+            self._monster_cache[url] = self._fetch_monster_info(url)
+        return self._monster_cache[url]
+
+    def _fetch_monster_info(self, url: str) -> Dict[str, str]:
+        """
+        Fetch the monster page at the url and extract its dictionary of monster data.
+        """
+        # Load in the monster page and parse it.
+        response = self.session.get(url=url)
 
         # The column names of information that we want to extract about the monster.
         keywords = self.configs["columns"]
 
-        # Clean the lines and remove lines that do not matter.
-        lines = text.split("\n")
-        lines = (line.strip() for line in lines)
-        lines = (line for line in lines if line)
-        lines = [line for line in lines if line.startswith(tuple(keywords))]
-
-        # Get raw information about an aspect of the monster.
-        monster_info = dict()
-        for keyword in keywords:
-            for line in lines:
-                if line.startswith(keyword):
-                    monster_info[keyword] = line
+        # Monster stats live in the page's infobox. When one exists, only walk its rows instead of
+        # materializing the text of the whole page. With lxml installed, both the infobox rows and
+        # the fallback text come straight from the C tree via XPath.
+        if lxml is not None:
+            tree = lxml.html.fromstring(response.content)
+            rows = tree.xpath(
+                '(//table[contains(@class, "infobox")] | //aside[contains(@class, "portable-infobox")])//tr')
+            if rows:
+                monster_info = {keyword: "" for keyword in keywords}
+                for row in rows:
+                    key = row.find("th")
+                    value = row.find("td")
+                    if key is None or value is None:
+                        continue
+                    key = key.text_content().strip().rstrip(":")
+                    if key in monster_info and not monster_info[key]:
+                        value = " ".join(value.text_content().split())
+                        monster_info[key] = value.replace("(List)", "").strip()
+                return monster_info
+            text = tree.get_element_by_id("mw-content-text").text_content()
+        else:
+            soup = bs4.BeautifulSoup(response.content, HTML_PARSER)
+            infobox = soup.select_one("table.infobox, aside.portable-infobox")
+            if infobox is not None:
+                monster_info = {keyword: "" for keyword in keywords}
+                for row in infobox.select("tr"):
+                    key = row.find("th")
+                    value = row.find("td")
+                    if key is None or value is None:
+                        continue
+                    key = key.get_text(strip=True).rstrip(":")
+                    if key in monster_info and not monster_info[key]:
+                        value = " ".join(value.get_text(" ", strip=True).split())
+                        monster_info[key] = value.replace("(List)", "").strip()
+                return monster_info
+            # Some pages have no infobox; fall back to scanning the page text line by line.
+            text = soup.find(id="mw-content-text").text
+
+        # One linear pass over the lines. The pre-compiled regex pulls out the keyword and its
+        # already-cleaned value at the same time, keeping only the first match per keyword.
+        # Stop scanning as soon as every keyword has a value; the stats sit near the top of the
+        # page, so this usually skips the bulk of the text.
+        monster_info = {keyword: "" for keyword in keywords}
+        remaining = set(monster_info)
+        for line in text.splitlines():
+            match = self._info_re.match(line.strip())
+            if match and match.group(1) in remaining:
+                monster_info[match.group(1)] = match.group(2).replace("(List)", "").strip()
+                remaining.discard(match.group(1))
+                if not remaining:
                     break
-            else:
-                monster_info[keyword] = ""
-
-        # Clean up the information found in the monster_info.
-        for key, value in monster_info.items():
-            value = value.replace(key, "")
-            value = value.replace(":", "")
-            value = value.replace("(List)", "")
-            value = value.strip()
-            monster_info[key] = value
 
         return monster_info
 
@@ -145,85 +333,95 @@ class DDOWikiScraper:
         Given a quest name and a set of candidate quest names, return the candidate that is most similar to the quest
         name. Similarity uses the edit distance between the quest name string and the candidate string.
         """
-        # Clean up the input variables.
+        # Normalize the candidates once per candidate list and memoize the result on the scraper.
+        # The memoized mapping (normalized name -> original name) doubles as the exact-match lookup
+        # and as pre-lowered, pre-stripped strings for the fuzzy scoring below.
         quest_name = str(quest_name)
-        candidate_names = [str(_) for _ in candidate_names]
-
-        # Collect the similarity scores (edit distance) of the candidates.
-        # The score in candidate_scores at index i corresponds with the name in candidate_names at index i.
-        candidate_scores = []
-        for candidate_name in candidate_names:
-            if candidate_name is None:
-                candidate_name = ""
-            candidate_name = str(candidate_name)
-            similarity = difflib.SequenceMatcher(
-                None, quest_name.lower().strip(), candidate_name.lower().strip()).ratio()
-            candidate_scores.append(similarity)
-
-        # Sort the candidates by their similarity scores.
-        candidates = sorted(list(zip(candidate_scores, candidate_names)), key=lambda x: x[0])
+        query = quest_name.lower().strip()
+        key = tuple(candidate_names)
+        normalized = self._normalized_candidates_cache.get(key)
+        if normalized is None:
+            normalized = {str(candidate).lower().strip(): str(candidate) for candidate in candidate_names}
+            self._normalized_candidates_cache[key] = normalized
+
+        # Fast path: if the quest name matches a candidate exactly (ignoring case and surrounding
+        # whitespace), skip the fuzzy scoring altogether.
+        if query in normalized:
+            return normalized[query]
+
+        # Prefer rapidfuzz, which scores every candidate in one C++ batch call.
+        # The processor handles the remaining per-string normalization for us.
+        if rapidfuzz is not None:
+            match = rapidfuzz.process.extractOne(
+                quest_name, list(normalized.values()),
+                scorer=rapidfuzz.fuzz.WRatio, processor=rapidfuzz.utils.default_process)
+            return match[0]
+
+        # Score the candidates with one reused SequenceMatcher. Keeping the query as seq2 means its
+        # reverse index is built once and shared across every comparison. real_quick_ratio and
+        # quick_ratio are cheap upper bounds on ratio, so candidates that cannot beat the current
+        # best are skipped without paying for the full quadratic ratio.
+        # autojunk's popular-character heuristic can misfire on short quest names, so turn it off.
+        best_score = -1.0
+        best_name = ""
+        matcher = difflib.SequenceMatcher(autojunk=False)
+        matcher.set_seq2(query)
+        for normalized_name, candidate_name in normalized.items():
+            matcher.set_seq1(normalized_name)
+            if matcher.real_quick_ratio() <= best_score or matcher.quick_ratio() <= best_score:
+                continue
+            score = matcher.ratio()
+            if score > best_score:
+                best_score = score
+                best_name = candidate_name
 
         # Return the candidate name with the highest similarity score.
-        return [y for x, y in candidates][-1]
+        return best_name
 
-    def get_lawfulness(self, alignments: Sequence[str]) -> List[str]:
+    def _split_alignments(self, alignments: Sequence[str]) -> pd.DataFrame:
         """
-        Given a list of strings representing alignments, extract the law vs. chaos parts and return them as a list.
+        Split alignment strings into their law vs. chaos (column 0) and good vs. evil (column 1)
+        parts using vectorized pandas string operations.
         We expect strings in alignments to look like one of these:
             (Lawful Good, Lawful Evil, Chaotic Good, Chaotic Evil, True Neutral, Neutral Good, Neutral Evil)
         """
-        lawfulness = []
-        for alignment in alignments:
-            if alignment:
-                alignment = alignment.strip()
-                # The "True Neutral" alignment is parsed differently than the other alignments.
-                # This is because it doesn't conform to the pattern:
-                # "[law vs chaos] [good vs evil]" - "Chaotic Good".
-                if alignment.lower() == "true neutral":
-                    alignment = "Neutral Neutral"
-
-                split = alignment.split(" ")
-
-                if len(split) < 1:
-                    lawfulness.append("")
-                elif len(split) == 1:
-                    lawfulness.append(split[0])
-                else:
-                    # We only want the first part. "Chaotic Good" -> "Chaotic".
-                    lawfulness.append(split[0])
-            else:
-                lawfulness.append("")
-
-        return lawfulness
+        series = pd.Series(alignments, dtype="object").fillna("").astype(str).str.strip()
+
+        # The "True Neutral" alignment is parsed differently than the other alignments.
+        # This is because it doesn't conform to the pattern:
+        # "[law vs chaos] [good vs evil]" - "Chaotic Good".
+        series = series.where(series.str.lower() != "true neutral", "Neutral Neutral")
+
+        # Reindex so both columns always exist; on empty or all-one-part input, expand=True yields
+        # fewer than two columns.
+        split = series.str.split(" ", n=1, expand=True)
+        split = split.reindex(columns=[0, 1])
+
+        # A one-part alignment supplies both halves. "Chaotic Good" -> ("Chaotic", "Good").
+        split[0] = split[0].fillna("")
+        split[1] = split[1].fillna(split[0])
+
+        return split
+
+    def _as_ordered_category(self, values: Sequence[str], categories: Sequence[str]) -> pd.Categorical:
+        """
+        Turn values into an ordered pandas Categorical using the supplied category order.
+        Unexpected values are appended after the known categories instead of becoming missing.
+        """
+        categories = list(categories) + sorted(set(values) - set(categories))
+        return pd.Categorical(values, categories=categories, ordered=True)
+
+    def get_lawfulness(self, alignments: Sequence[str]) -> List[str]:
+        """
+        Given a list of strings representing alignments, extract the law vs. chaos parts and return them as a list.
+        """
+        return self._split_alignments(alignments)[0].tolist()
 
     def get_goodness(self, alignments: Sequence[str]) -> List[str]:
         """
         Given a list of strings representing alignments, extract the good vs. evil parts and return them as a list.
-        We expect strings in alignments to look like one of these:
-            (Lawful Good, Lawful Evil, Chaotic Good, Chaotic Evil, True Neutral, Neutral Good, Neutral Evil)
         """
-        goodness = []
-        for alignment in alignments:
-            if alignment:
-                alignment = alignment.strip()
-                # The "True Neutral" alignment is parsed differently than the other alignments.
-                # This is because it doesn't conform to the pattern:
-                # "[law vs chaos] [good vs evil]" - "Chaotic Good".
-                if alignment.lower() == "true neutral":
-                    alignment = "Neutral Neutral"
-
-                split = alignment.split(" ")
-
-                if len(split) < 1:
-                    goodness.append("")
-                elif len(split) == 1:
-                    goodness.append(split[0])
-                else:
-                    # We only want the second part. "Chaotic Good" -> "Good".
-                    goodness.append(split[1])
-            else:
-                goodness.append("")
-        return goodness
+        return self._split_alignments(alignments)[1].tolist()
 
 
 def main_loop() -> None:
@@ -233,6 +431,22 @@ def main_loop() -> None:
     2. Display the monster information of that quest.
     3. Repeat the prior steps until the user inputs "quit" to leave the loop.
     """
+    # Load the configs once. They do not change while the loop is running.
+    # Parse with PyYAML's C-based safe loader when it was built in; it is much faster than the
+    # pure-Python loader and just as safe.
+    root = utils.get_project_root()
+    configs_path = os.path.realpath(os.path.join(root, "configs.yaml"))
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    try:
+        with open(configs_path, "r") as file:
+            configs = yaml.load(file, Loader=loader)
+    except FileNotFoundError:
+        print(f"Could not find {configs_path}. Make sure that it exists.")
+        return
+
+    # Use one scraper for the whole session so its caches carry over between queries.
+    scraper = DDOWikiScraper(configs)
+
     while True:
         # Ask the user to supply a quest name.
         print("\nPlease enter a quest name. Enter 'quit' to leave.")
@@ -243,18 +457,7 @@ def main_loop() -> None:
         if user_input in ("q", "quit", "exit"):
             break
 
-        # Load the configs.
-        root = utils.get_project_root()
-        configs_path = os.path.realpath(os.path.join(root, "configs.yaml"))
-        try:
-            with open(configs_path, "r") as file:
-                configs = yaml.safe_load(file)
-        except FileNotFoundError:
-            print(f"Could not find {configs_path}. Make sure that it exists.")
-            break
-
         # Get the monsters found in the user-specified quest. Display their information.
-        scraper = DDOWikiScraper(configs)
         df = scraper.get_monsters_in_quest(user_input)
         print(df)
 